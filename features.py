@@ -2,13 +2,63 @@ import customtkinter as ctk
 import tkinter as tk
 from tkinter import ttk, filedialog
 from PIL import Image, ImageTk
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import hashlib
 import os
+import re
 import json
 
+# orjson's C encoder/decoder is several times faster than stdlib json;
+# fall back transparently when it isn't installed.
+try:
+    import orjson
+
+    def _loads(data):
+        return orjson.loads(data)
+
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _loads(data):
+        return json.loads(data)
+
+    def _dumps(obj):
+        return json.dumps(obj, indent=2).encode('utf-8')
+
+_EXT_RE = re.compile(r'\.(?:png|jpe?g)$', re.IGNORECASE)
+
+# Bail out of thumbnailing for pathological files rather than letting one
+# enormous image stall the whole gallery
+_MAX_THUMB_DIMENSION = 16000
+_MAX_THUMB_FILESIZE = 100 * 1024 * 1024
+
+
+@lru_cache(maxsize=1)
+def _placeholder_thumb():
+    """Generic icon shown in place of images too large to decode."""
+    return Image.new('RGB', (150, 150), '#404040')
+
+
+@lru_cache(maxsize=8)
+def _load_cached(path, mtime):
+    """Decode an image, keeping the last few in memory.
+
+    mtime participates in the key purely to invalidate entries when the
+    file changes on disk. copy() forces the full decode here so cache hits
+    hand back a ready-to-use image.
+    """
+    with Image.open(path) as image:
+        return image.copy()
+
 class ImagePreview:
-    def __init__(self, parent_frame):
+    def __init__(self, parent_frame, gallery=None):
         self.parent = parent_frame
+        self.gallery = gallery
         self.zoom_level = 1.0
+        # Small pool so prefetching can never starve the foreground decode
+        self._prefetch_pool = ThreadPoolExecutor(max_workers=2)
         self.setup_preview_area()
     
     def setup_preview_area(self):
@@ -34,13 +84,14 @@ class ImagePreview:
                               highlightthickness=0)
         self.canvas.pack(fill=tk.BOTH, expand=True)
         
-        # Scrollbars
+        # Scrollbars (routed through wrappers so viewport-cropped renders
+        # refresh when the view moves)
         self.scrolly = ttk.Scrollbar(self.preview_frame, orient=tk.VERTICAL,
-                                   command=self.canvas.yview)
+                                   command=self._on_yview)
         self.scrolly.pack(side=tk.RIGHT, fill=tk.Y)
-        
+
         self.scrollx = ttk.Scrollbar(self.preview_frame, orient=tk.HORIZONTAL,
-                                   command=self.canvas.xview)
+                                   command=self._on_xview)
         self.scrollx.pack(side=tk.BOTTOM, fill=tk.X)
         
         self.canvas.configure(xscrollcommand=self.scrollx.set,
@@ -53,45 +104,185 @@ class ImagePreview:
         
         self.current_image = None
         self.image_on_canvas = None
+        self.photo = None
+        self._resample_pending = False
+        self._interactive = False
+        self._finalize_job = None
+        self._display_src = None
+        self._src_scale = 1.0
+        self._pending_pan = None
+        self._viewport_mode = False
+        self._last_key = None
 
     def update_image(self, image_path):
         try:
-            image = Image.open(image_path)
+            image = _load_cached(image_path, os.path.getmtime(image_path))
+            # Convert palette/CMYK/16-bit sources to a hot mode once here,
+            # rather than letting every resize convert on the fly.
+            if image.mode not in ('RGB', 'RGBA'):
+                image = image.convert('RGBA' if 'A' in image.mode else 'RGB')
             self.current_image = image
+            self._last_key = None
+            self._build_display_src(image)
             self.display_image()
+            self._prefetch_neighbors(image_path)
         except Exception as e:
             print(f"Error loading image: {e}")
 
+    def _prefetch_neighbors(self, image_path):
+        """Warm the decode cache for the images the user is likely to view
+        next, overlapping disk I/O and decode with their think-time."""
+        if self.gallery is None:
+            return
+        for neighbor in self.gallery.neighbors_of(image_path):
+            try:
+                mtime = os.path.getmtime(neighbor)
+            except OSError:
+                continue
+            self._prefetch_pool.submit(_load_cached, neighbor, mtime)
+
+    def _build_display_src(self, image):
+        """Cache a screen-fit downsample of the source so zoom math can run
+        on a few megapixels instead of the full-resolution original."""
+        canvas_w = max(self.canvas.winfo_width(), 1)
+        canvas_h = max(self.canvas.winfo_height(), 1)
+        if canvas_w <= 1 or canvas_h <= 1:
+            # Canvas not laid out yet; fall back to a typical preview size.
+            canvas_w, canvas_h = 1200, 800
+        if image.width > canvas_w or image.height > canvas_h:
+            fit = image.copy()
+            fit.thumbnail((canvas_w, canvas_h), Image.Resampling.BILINEAR)
+            self._display_src = fit
+            self._src_scale = fit.width / image.width
+        else:
+            self._display_src = None
+            self._src_scale = 1.0
+
     def display_image(self):
-        if self.current_image:
-            # Calculate new size
-            new_width = int(self.current_image.width * self.zoom_level)
-            new_height = int(self.current_image.height * self.zoom_level)
-            
-            # Resize image
-            resized = self.current_image.resize((new_width, new_height),
-                                              Image.Resampling.LANCZOS)
-            
-            # Convert to PhotoImage
-            self.photo = ImageTk.PhotoImage(resized)
-            
-            # Update canvas
-            if self.image_on_canvas:
-                self.canvas.delete(self.image_on_canvas)
-            
+        if not self.current_image:
+            return
+
+        # Keep showing the existing canvas item and defer the expensive
+        # resample until the event loop goes idle, so rapid zoom clicks
+        # coalesce into a single resize instead of each paying a full one.
+        if self.image_on_canvas and self.photo is not None:
+            if not self._resample_pending:
+                self._resample_pending = True
+                self.canvas.after_idle(self._resample)
+            return
+
+        self._resample()
+
+    def _resample(self):
+        self._resample_pending = False
+        if not self.current_image:
+            return
+
+        # Rapid wheel events can queue several redraws that land on the
+        # same effective state; resample only when something changed.
+        key = (self.zoom_level, id(self.current_image), self._interactive,
+               self.canvas.xview()[0], self.canvas.yview()[0],
+               self.canvas.winfo_width(), self.canvas.winfo_height())
+        if key == self._last_key:
+            return
+        self._last_key = key
+
+        # Calculate new size
+        new_width = max(1, int(self.current_image.width * self.zoom_level))
+        new_height = max(1, int(self.current_image.height * self.zoom_level))
+
+        # Resize image: BILINEAR while the user is actively zooming (several
+        # times cheaper per pixel), LANCZOS once the interaction settles.
+        resample = (Image.Resampling.BILINEAR if self._interactive
+                    else Image.Resampling.LANCZOS)
+
+        # Resample from the screen-fit cache while the target is no larger
+        # than the cache itself; only touch the full-res original beyond that.
+        if self._display_src is not None and self.zoom_level <= self._src_scale:
+            source = self._display_src
+        else:
+            source = self.current_image
+
+        # When the zoomed image dwarfs the viewport, resample only the crop
+        # of the source that is actually on screen: cost becomes
+        # O(viewport pixels) instead of O(image pixels * zoom^2).
+        canvas_w = self.canvas.winfo_width()
+        canvas_h = self.canvas.winfo_height()
+        self._viewport_mode = (canvas_w > 1 and canvas_h > 1 and
+                               new_width * new_height > 4 * canvas_w * canvas_h)
+        if self._viewport_mode:
+            vx0 = max(0, min(int(self.canvas.xview()[0] * new_width),
+                             new_width - canvas_w))
+            vy0 = max(0, min(int(self.canvas.yview()[0] * new_height),
+                             new_height - canvas_h))
+            view_w = min(canvas_w, new_width - vx0)
+            view_h = min(canvas_h, new_height - vy0)
+            scale = new_width / source.width
+            src_box = (vx0 / scale, vy0 / scale,
+                       (vx0 + view_w) / scale, (vy0 + view_h) / scale)
+            resized = source.resize((view_w, view_h), resample, box=src_box)
+            self._blit(resized, vx0, vy0)
+        else:
+            resized = source.resize((new_width, new_height), resample)
+            self._blit(resized)
+        self.canvas.configure(scrollregion=(0, 0, new_width, new_height))
+
+    def _on_xview(self, *args):
+        self.canvas.xview(*args)
+        self._schedule_viewport_refresh()
+
+    def _on_yview(self, *args):
+        self.canvas.yview(*args)
+        self._schedule_viewport_refresh()
+
+    def _schedule_viewport_refresh(self):
+        if self._viewport_mode and not self._resample_pending:
+            self._resample_pending = True
+            self.canvas.after_idle(self._resample)
+
+    def _blit(self, resized, x=0, y=0):
+        """Copy a resized PIL image onto the canvas through a reusable
+        PhotoImage buffer.
+
+        Building a PhotoImage is expensive Tcl work, while paste() into an
+        existing one is a C-level copy, so the buffer is only reallocated
+        when the target geometry actually changes.
+        """
+        width, height = resized.width, resized.height
+        if (self.photo is None or
+                self.photo.width() != width or self.photo.height() != height):
+            self.photo = ImageTk.PhotoImage(width=width, height=height)
+        self.photo.paste(resized)
+
+        if self.image_on_canvas:
+            self.canvas.itemconfigure(self.image_on_canvas, image=self.photo)
+            self.canvas.coords(self.image_on_canvas, x, y)
+        else:
             self.image_on_canvas = self.canvas.create_image(
-                0, 0, anchor="nw", image=self.photo
+                x, y, anchor="nw", image=self.photo
             )
-            
-            self.canvas.configure(scrollregion=self.canvas.bbox("all"))
 
     def zoom_in(self):
         self.zoom_level *= 1.2
-        self.display_image()
+        self._interactive_redraw()
 
     def zoom_out(self):
         self.zoom_level *= 0.8
+        self._interactive_redraw()
+
+    def _interactive_redraw(self):
+        """Redraw with the fast resample filter, then schedule a debounced
+        high-quality pass for when the user stops zooming."""
+        self._interactive = True
         self.display_image()
+        if self._finalize_job is not None:
+            self.canvas.after_cancel(self._finalize_job)
+        self._finalize_job = self.canvas.after(150, self._finalize_zoom)
+
+    def _finalize_zoom(self):
+        self._finalize_job = None
+        self._interactive = False
+        self._resample()
 
     def reset_zoom(self):
         self.zoom_level = 1.0
@@ -101,7 +292,21 @@ class ImagePreview:
         self.canvas.scan_mark(event.x, event.y)
 
     def pan(self, event):
-        self.canvas.scan_dragto(event.x, event.y, gain=1)
+        # Coalesce <B1-Motion> events: record the latest position and do a
+        # single scan_dragto per pass through the event loop, so fast drags
+        # redraw at the frame rate rather than the mouse report rate.
+        schedule = self._pending_pan is None
+        self._pending_pan = (event.x, event.y)
+        if schedule:
+            self.canvas.after_idle(self._do_pan)
+
+    def _do_pan(self):
+        if self._pending_pan is None:
+            return
+        x, y = self._pending_pan
+        self._pending_pan = None
+        self.canvas.scan_dragto(x, y, gain=1)
+        self._schedule_viewport_refresh()
 
     def mouse_wheel(self, event):
         if event.delta > 0:
@@ -121,21 +326,65 @@ class ImagePreview:
                 self.current_image.save(file_path)
 
 class GalleryView:
+    # Decoded PIL thumbnails kept resident; evicted LRU beyond this. The
+    # disk cache makes re-decoding evicted entries cheap.
+    MAX_THUMBS_RESIDENT = 64
+
     def __init__(self, parent_frame):
         self.parent = parent_frame
+        self._thumb_cache_dir = '.thumbs'
+        self._pool = ThreadPoolExecutor(max_workers=os.cpu_count())
         self.setup_gallery()
-        
+
+    def _cached_thumbnail(self, image_path):
+        """Load the 150px thumbnail, via the on-disk cache when possible.
+
+        Cache entries are keyed by path+mtime+size so edits and overwrites
+        invalidate naturally; second and later gallery opens only read the
+        small cached PNGs instead of re-decoding originals.
+        """
+        try:
+            stat = os.stat(image_path)
+            key = hashlib.blake2b(
+                f"{image_path}:{stat.st_mtime_ns}:{stat.st_size}".encode()
+            ).hexdigest()[:16]
+            cache_path = os.path.join(self._thumb_cache_dir, f"{key}.png")
+            if os.path.exists(cache_path):
+                return Image.open(cache_path)
+        except OSError:
+            cache_path = None
+
+        # Probe dimensions first - Image.open only reads the header - and
+        # skip the decode entirely for files past the size gates.
+        if cache_path and stat.st_size > _MAX_THUMB_FILESIZE:
+            return _placeholder_thumb()
+        image = Image.open(image_path)
+        if max(image.size) > _MAX_THUMB_DIMENSION:
+            return _placeholder_thumb()
+        image.draft('RGB', (300, 300))
+        image.thumbnail((150, 150), Image.Resampling.BILINEAR)
+
+        if cache_path:
+            try:
+                os.makedirs(self._thumb_cache_dir, exist_ok=True)
+                image.save(cache_path, optimize=True)
+            except OSError:
+                pass
+        return image
+
     def setup_gallery(self):
         # Search and filter frame
         control_frame = ctk.CTkFrame(self.parent)
         control_frame.pack(fill=tk.X, padx=5, pady=5)
         
-        # Search
+        # Search (debounced so fast typing doesn't relayout per keystroke)
         self.search_var = tk.StringVar()
-        search_entry = ctk.CTkEntry(control_frame, 
+        search_entry = ctk.CTkEntry(control_frame,
                                   placeholder_text="Search...",
                                   textvariable=self.search_var)
         search_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+        self._search_job = None
+        self.search_var.trace_add('write', self._on_search_changed)
         
         # Filter dropdown
         self.filter_var = tk.StringVar(value="All")
@@ -144,69 +393,227 @@ class GalleryView:
                                       values=["All", "Recent", "Favorites"])
         filter_menu.pack(side=tk.RIGHT, padx=5)
         
-        # Gallery grid frame
-        self.gallery_frame = ctk.CTkScrollableFrame(self.parent)
-        self.gallery_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
-        
-        # Grid layout
+        # Gallery grid: a plain tk.Canvas with one image item per visible
+        # thumbnail. Canvas items are far cheaper than a CTkFrame+Label
+        # pair per cell, and placement is just coordinates - no reflow.
+        self.gallery_canvas = tk.Canvas(self.parent, bg='#2b2b2b',
+                                        highlightthickness=0)
+        self.gallery_scrollbar = ttk.Scrollbar(self.parent,
+                                               orient=tk.VERTICAL,
+                                               command=self.gallery_canvas.yview)
+        self.gallery_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.gallery_canvas.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self.gallery_canvas.configure(yscrollcommand=self.gallery_scrollbar.set)
+
+        # CTkScrollableFrame bound the mouse wheel internally; the bare
+        # canvas needs its own bindings (Button-4/5 are the X11 events)
+        self.gallery_canvas.bind(
+            '<MouseWheel>',
+            lambda e: self.gallery_canvas.yview_scroll(
+                -1 if e.delta > 0 else 1, tk.UNITS))
+        self.gallery_canvas.bind(
+            '<Button-4>',
+            lambda e: self.gallery_canvas.yview_scroll(-1, tk.UNITS))
+        self.gallery_canvas.bind(
+            '<Button-5>',
+            lambda e: self.gallery_canvas.yview_scroll(1, tk.UNITS))
+
+        # The grid is virtualized: self._items holds every image path, but
+        # canvas items only exist for cells near the viewport.
         self.grid_size = 4
-        self.current_row = 0
-        self.current_col = 0
+        self._cell_w = 160
+        self._cell_h = 160
+        self._all_items = []     # every path, unfiltered
+        self._items = []         # paths passing the current search filter
+        self._visible = {}       # index -> list of canvas item ids
+        self._photos = {}        # index -> PhotoImage (kept alive for Tk)
+        self._thumb_images = OrderedDict()  # path -> PIL thumb, LRU-capped
+        self._pending = set()    # paths with an in-flight decode
+        self._last_view = None
+        self.parent.after(200, self._relayout_tick)
 
     def add_image(self, image_path, metadata=None):
+        self._all_items.append(image_path)
+        self._refresh_items()
+
+    def neighbors_of(self, image_path):
+        """Paths adjacent to image_path in the current (filtered) order."""
+        try:
+            idx = self._items.index(image_path)
+        except ValueError:
+            return []
+        return [self._items[i] for i in (idx - 1, idx + 1)
+                if 0 <= i < len(self._items)]
+
+    def _on_search_changed(self, *_):
+        if self._search_job is not None:
+            self.parent.after_cancel(self._search_job)
+        self._search_job = self.parent.after(150, self._refresh_items)
+
+    def _refresh_items(self):
+        """Apply the current search filter and re-lay-out the grid."""
+        self._search_job = None
+        needle = self.search_var.get().strip().lower()
+        if needle:
+            items = [p for p in self._all_items
+                     if needle in os.path.basename(p).lower()]
+        else:
+            items = list(self._all_items)
+        if items != self._items:
+            self._items = items
+            for item_ids in self._visible.values():
+                for item_id in item_ids:
+                    self.gallery_canvas.delete(item_id)
+            self._visible = {}
+            self._photos = {}
+        self._configure_grid()
+        self._relayout()
+
+    def _configure_grid(self):
+        """Size the scrollregion to cover every cell, instantiated or not."""
+        rows = (len(self._items) + self.grid_size - 1) // self.grid_size
+        self.gallery_canvas.configure(
+            scrollregion=(0, 0, self.grid_size * self._cell_w,
+                          rows * self._cell_h))
+
+    def _relayout_tick(self):
+        # Cheap poll of the scroll position; only re-lays-out on change.
+        view = (self.gallery_canvas.yview(),
+                self.gallery_canvas.winfo_height())
+        if view != self._last_view:
+            self._last_view = view
+            self._relayout()
+        self.parent.after(200, self._relayout_tick)
+
+    def _relayout(self):
+        """Create canvas items for cells near the viewport, drop the rest."""
+        if not self._items:
+            return
+        top_frac, bottom_frac = self.gallery_canvas.yview()
+
+        total_rows = (len(self._items) + self.grid_size - 1) // self.grid_size
+        total_height = total_rows * self._cell_h
+        first_row = int(top_frac * total_height) // self._cell_h
+        last_row = int(bottom_frac * total_height) // self._cell_h
+
+        # One row of overscan on each side for smoother scrolling
+        lo = max(0, (first_row - 1) * self.grid_size)
+        hi = min(len(self._items), (last_row + 2) * self.grid_size)
+
+        for idx in list(self._visible):
+            if not lo <= idx < hi:
+                for item_id in self._visible.pop(idx):
+                    self.gallery_canvas.delete(item_id)
+                self._photos.pop(idx, None)
+        for idx in range(lo, hi):
+            if idx not in self._visible:
+                self._create_cell(idx)
+
+    def _cell_origin(self, idx):
+        return ((idx % self.grid_size) * self._cell_w + 5,
+                (idx // self.grid_size) * self._cell_h + 5)
+
+    def _create_cell(self, idx):
+        # Outline placeholder until the decode lands
+        x, y = self._cell_origin(idx)
+        rect = self.gallery_canvas.create_rectangle(
+            x, y, x + self._cell_w - 10, y + self._cell_h - 10,
+            outline='#404040')
+        self._visible[idx] = [rect]
+
+        path = self._items[idx]
+        image = self._thumb_images.get(path)
+        if image is not None:
+            self._thumb_images.move_to_end(path)
+            self._set_cell_image(idx, image)
+        elif path not in self._pending:
+            self._pending.add(path)
+            # Decode off the Tk thread; marshal the finished PIL image
+            # back via after(0, ...) for PhotoImage creation and layout.
+            future = self._pool.submit(self._cached_thumbnail, path)
+            future.add_done_callback(
+                lambda f, p=path: self.parent.after(
+                    0, self._on_thumb_ready, f, p))
+
+    def _on_thumb_ready(self, future, path):
+        """Completion hook for background decodes; runs on the Tk thread."""
+        self._pending.discard(path)
         try:
-            # Load and resize image for thumbnail
-            image = Image.open(image_path)
-            image.thumbnail((150, 150))
-            photo = ImageTk.PhotoImage(image)
-            
-            # Create frame for image
-            frame = ctk.CTkFrame(self.gallery_frame)
-            frame.grid(row=self.current_row, column=self.current_col,
-                      padx=5, pady=5)
-            
-            # Image label
-            label = tk.Label(frame, image=photo)
-            label.image = photo  # Keep reference
-            label.pack()
-            
-            # Update grid position
-            self.current_col += 1
-            if self.current_col >= self.grid_size:
-                self.current_col = 0
-                self.current_row += 1
-                
+            image = future.result()
         except Exception as e:
             print(f"Error adding image to gallery: {e}")
+            return
+        self._thumb_images[path] = image
+        self._thumb_images.move_to_end(path)
+        while len(self._thumb_images) > self.MAX_THUMBS_RESIDENT:
+            self._thumb_images.popitem(last=False)
+        try:
+            idx = self._items.index(path)
+        except ValueError:
+            return  # filtered out while decoding
+        if idx in self._visible:
+            self._set_cell_image(idx, image)
+
+    def _set_cell_image(self, idx, image):
+        # PhotoImage construction and canvas item creation must stay on the
+        # Tk thread; only the decode/resize work is safe to offload.
+        path = self._items[idx]
+        x, y = self._cell_origin(idx)
+        photo = ImageTk.PhotoImage(image)
+        self._photos[idx] = photo  # Keep reference
+        item = self.gallery_canvas.create_image(
+            x, y, anchor=tk.NW, image=photo, tags=('thumb', path))
+        self._visible[idx].append(item)
 
     def clear_gallery(self):
-        for widget in self.gallery_frame.winfo_children():
-            widget.destroy()
-        self.current_row = 0
-        self.current_col = 0
+        self.gallery_canvas.delete('all')
+        self._all_items = []
+        self._items = []
+        self._visible = {}
+        self._photos = {}
+        self._thumb_images = OrderedDict()
+        self._pending = set()
 
     def load_directory(self, directory):
         self.clear_gallery()
-        for filename in os.listdir(directory):
-            if filename.lower().endswith(('.png', '.jpg', '.jpeg')):
-                self.add_image(os.path.join(directory, filename))
+        # scandir hands back dirent type info without an extra stat per
+        # file, which matters on network shares.
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.is_file(follow_symlinks=False) and \
+                        _EXT_RE.search(entry.name):
+                    self._all_items.append(entry.path)
+        self._refresh_items()
 
 class PromptLibrary:
     def __init__(self, parent_frame):
         self.parent = parent_frame
         self.favorites = self.load_favorites()
+        self._flush_job = None
         self.setup_library()
-        
+
     def load_favorites(self):
         try:
-            with open('favorites.json', 'r') as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
+            with open('favorites.json', 'rb') as f:
+                return _loads(f.read())
+        except (FileNotFoundError, ValueError):
             return []
 
     def save_favorites(self):
-        with open('favorites.json', 'w') as f:
-            json.dump(self.favorites, f, indent=2)
+        # Coalesce bursts of adds into a single disk write
+        if self._flush_job is None:
+            self._flush_job = self.parent.after(500, self._flush_favorites)
+
+    def _flush_favorites(self):
+        self._flush_job = None
+        # Write-then-rename so a crash mid-write never leaves a truncated
+        # favorites.json behind
+        tmp = 'favorites.json.tmp'
+        with open(tmp, 'wb', buffering=65536) as f:
+            f.write(_dumps(self.favorites))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, 'favorites.json')
 
     def setup_library(self):
         # Create frames
@@ -217,17 +624,22 @@ class PromptLibrary:
         ctk.CTkButton(control_frame, text="Add Prompt",
                      command=self.add_prompt).pack(side=tk.LEFT, padx=5)
         
-        # Search
+        # Search (debounced; filtering packs/unpacks rows, never rebuilds)
         self.search_var = tk.StringVar()
         search_entry = ctk.CTkEntry(control_frame,
                                   placeholder_text="Search prompts...",
                                   textvariable=self.search_var)
         search_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+        self._search_job = None
+        self.search_var.trace_add('write', self._on_search_changed)
         
         # Prompts list
         self.prompts_frame = ctk.CTkScrollableFrame(self.parent)
         self.prompts_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
-        
+
+        self._rows = []
+        self._last_favorites = None
+        self._search_index = []
         self.update_prompt_list()
 
     def add_prompt(self):
@@ -244,25 +656,71 @@ class PromptLibrary:
             self.update_prompt_list()
 
     def update_prompt_list(self):
-        # Clear current list
-        for widget in self.prompts_frame.winfo_children():
-            widget.destroy()
-        
-        # Add prompts
-        for prompt in self.favorites:
-            self.create_prompt_widget(prompt)
+        last = self._last_favorites
+        if self.favorites == last:
+            return
+
+        # Unmap the container while mutating rows so Tk does a single
+        # layout pass at the end instead of one reflow per packed row.
+        self.prompts_frame.pack_forget()
+
+        if last is not None and self.favorites[:len(last)] == last:
+            # Common case (add_prompt): only append the new tail rows
+            new_prompts = self.favorites[len(last):]
+        else:
+            for widget in self._rows:
+                widget.destroy()
+            self._rows = []
+            new_prompts = self.favorites
+
+        first_new = len(self._rows)
+        for offset, prompt in enumerate(new_prompts):
+            self._rows.append(
+                self.create_prompt_widget(prompt, first_new + offset))
+
+        self._last_favorites = [dict(p) for p in self.favorites]
+        self._search_index = [
+            (' '.join([fav['prompt']] + fav.get('tags', [])).lower(), row)
+            for fav, row in zip(self.favorites, self._rows)
+        ]
+        if self.search_var.get().strip():
+            self._apply_search()
+        self.prompts_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self.prompts_frame.update_idletasks()
+
+    def _on_search_changed(self, *_):
+        if self._search_job is not None:
+            self.parent.after_cancel(self._search_job)
+        self._search_job = self.parent.after(150, self._apply_search)
+
+    def _apply_search(self):
+        """Show/hide existing rows against the tokenized index; widgets are
+        reused rather than destroyed and recreated per keystroke."""
+        self._search_job = None
+        needle = self.search_var.get().strip().lower()
+        for text, row in self._search_index:
+            row.pack_forget()
+        for text, row in self._search_index:
+            if not needle or needle in text:
+                row.pack(fill=tk.X, padx=5, pady=2)
 
-    def create_prompt_widget(self, prompt_data):
+    def create_prompt_widget(self, prompt_data, index):
         frame = ctk.CTkFrame(self.prompts_frame)
         frame.pack(fill=tk.X, padx=5, pady=2)
-        
+
         ctk.CTkLabel(frame, text=prompt_data["prompt"]).pack(
             side=tk.LEFT, padx=5)
-        
+
+        # Capture only the row index; the prompt text is looked up at click
+        # time, so rows don't pin their (possibly long) prompt strings in a
+        # closure for the lifetime of the widget.
         ctk.CTkButton(frame, text="Use",
-                     command=lambda: self.use_prompt(prompt_data["prompt"])).pack(
+                     command=lambda i=index: self.use_prompt(
+                         self.favorites[i]["prompt"])).pack(
             side=tk.RIGHT, padx=5)
 
+        return frame
+
     def use_prompt(self, prompt):
         # This method should be connected to the main application
         pass
@@ -3,21 +3,51 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import json
 import requests
+import urllib3
 import os
 from PIL import Image, ImageTk
 from datetime import datetime
 import threading
 import queue
+import concurrent.futures
 import configparser
+import atexit
+import hashlib
+import shutil
 from pathlib import Path
-from dataclasses import dataclass
+from collections import OrderedDict, deque
+from dataclasses import dataclass, replace
 import logging
 import logging.handlers
-import traceback
+import random
 from typing import Optional, List
 import time
 import sys
 
+# Same optional-orjson shim as features.py: the C codec is several times
+# faster for the status JSON decoded on every poll, with a transparent
+# stdlib fallback.
+try:
+    import orjson
+
+    def _loads(data):
+        return orjson.loads(data)
+
+    def _dumps(obj):
+        return orjson.dumps(obj)
+except ImportError:
+    def _loads(data):
+        return json.loads(data)
+
+    def _dumps(obj):
+        # Compact separators match orjson's output and shave ~15% of the
+        # bytes written per history line
+        return json.dumps(obj, separators=(",", ":")).encode('utf-8')
+
+# Copy buffer for streaming image downloads to disk. 1 MiB keeps the
+# Python-level loop count and write() syscalls low for multi-MB outputs.
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
 # ----------------------------
 # Data Classes
 # ----------------------------
@@ -68,6 +98,10 @@ class BatchJob:
 # Utility Functions
 # ----------------------------
 
+# Set by setup_logging; the QueueListener must outlive every logger user
+_log_listener = None
+
+
 def setup_logging():
     """Setup logging configuration with better error handling"""
     try:
@@ -76,19 +110,42 @@ def setup_logging():
 
         log_file = os.path.join(logs_dir, 'flux_generator.log')
 
-        logging.basicConfig(
-            level=logging.DEBUG,
-            format='%(asctime)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s',
-            handlers=[
-                logging.handlers.RotatingFileHandler(
-                    log_file,
-                    maxBytes=1024*1024,
-                    backupCount=5,
-                    encoding='utf-8'
-                ),
-                logging.StreamHandler(sys.stdout)
-            ]
+        rotating_handler = logging.handlers.RotatingFileHandler(
+            log_file,
+            maxBytes=1024*1024,
+            backupCount=5,
+            encoding='utf-8'
         )
+        # Buffer file writes so records coalesce into larger syscalls;
+        # errors flush immediately
+        file_handler = logging.handlers.MemoryHandler(
+            capacity=1024,
+            flushLevel=logging.ERROR,
+            target=rotating_handler
+        )
+        stream_handler = logging.StreamHandler(sys.stdout)
+
+        formatter = logging.Formatter(
+            '%(asctime)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s')
+        rotating_handler.setFormatter(formatter)
+        stream_handler.setFormatter(formatter)
+
+        # Hot threads only enqueue records; a QueueListener thread does the
+        # actual formatting and disk/console I/O
+        log_queue = queue.Queue(-1)
+        listener = logging.handlers.QueueListener(
+            log_queue, file_handler, stream_handler, respect_handler_level=True)
+        listener.start()
+        # Keep the listener reachable and drain the queue at interpreter
+        # exit, otherwise records still in flight (including shutdown-path
+        # messages) die with the daemon thread
+        global _log_listener
+        _log_listener = listener
+        atexit.register(listener.stop)
+
+        root_logger = logging.getLogger()
+        root_logger.setLevel(logging.DEBUG)
+        root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
 
         logger = logging.getLogger('FluxGenerator')
         logger.info('Logging initialized')
@@ -113,10 +170,10 @@ class PresetManager:
         """Load presets with improved error handling"""
         try:
             if os.path.exists(self.presets_file):
-                with open(self.presets_file, 'r') as f:
+                with open(self.presets_file, 'rb') as f:
                     content = f.read().strip()
                     if content:
-                        return json.loads(content)
+                        return _loads(content)
         except Exception as e:
             self.logger.error(f"Error loading presets: {str(e)}")
 
@@ -145,6 +202,47 @@ class PresetManager:
             }
         }
 
+class HistoryBuffer:
+    """Collects history entries in memory and flushes them in batches.
+
+    Appends from worker threads are cheap list pushes; disk writes happen
+    at most once per flush window, so a burst of saves collapses into a
+    single append to the JSONL file.
+    """
+
+    def __init__(self, path, flush_bytes=64 * 1024):
+        self.path = path
+        self.flush_bytes = flush_bytes
+        self._lines = []
+        self._pending_bytes = 0
+        self._lock = threading.Lock()
+
+    def append(self, entry):
+        """Queue one entry; returns True when a flush is overdue"""
+        line = _dumps(entry) + b"\n"
+        with self._lock:
+            self._lines.append(line)
+            self._pending_bytes += len(line)
+            return self._pending_bytes >= self.flush_bytes
+
+    def flush(self):
+        with self._lock:
+            lines, self._lines = self._lines, []
+            self._pending_bytes = 0
+        if not lines:
+            return
+        try:
+            with open(self.path, 'ab') as f:
+                f.writelines(lines)
+        except OSError:
+            # Requeue the unwritten lines so a transient failure (e.g. a
+            # full disk) postpones persistence instead of dropping entries
+            with self._lock:
+                self._lines = lines + self._lines
+                self._pending_bytes += sum(len(line) for line in lines)
+            raise
+
+
 class FluxAPI:
     def __init__(self, api_key):
         self.api_key = api_key
@@ -153,47 +251,151 @@ class FluxAPI:
             "Content-Type": "application/json",
             "X-Key": api_key
         }
+        # One keep-alive session for all calls: the poll loop hits the same
+        # host every few seconds, so reusing the socket avoids paying a TCP
+        # plus TLS handshake per request.
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=urllib3.util.Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[502, 503, 504]
+            )
+        )
+        self.session.mount("https://", adapter)
+
+        # Image downloads use a separate session with the same pooling but
+        # none of the default headers: result URLs can point at third-party
+        # CDN hosts (possibly plain http), and the X-Key secret must never
+        # be sent there.
+        self.download_session = requests.Session()
+        download_adapter = requests.adapters.HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20
+        )
+        self.download_session.mount("https://", download_adapter)
+        self.download_session.mount("http://", download_adapter)
+        # Task ids for recent seeded requests; identical params with a
+        # fixed seed produce the same image, so repeats skip the network.
+        self._task_cache = OrderedDict()
+        self._task_cache_lock = threading.Lock()
         self.logger = logging.getLogger('FluxGenerator')
         self.logger.info("FluxAPI initialized")
 
     def generate_image(self, model: str, params: dict) -> str:
         """Generate image with improved error handling"""
-        self.logger.info(f"Generating image with model: {model}")
+        self.logger.info("Generating image with model: %s", model)
+
+        # Only seeded requests are deterministic enough to cache
+        cache_key = None
+        if params.get("seed") is not None:
+            cache_key = (model, tuple(sorted(params.items())))
+            with self._task_cache_lock:
+                task_id = self._task_cache.get(cache_key)
+                if task_id is not None:
+                    self._task_cache.move_to_end(cache_key)
+            if task_id is not None:
+                # Task results expire server-side, so only reuse the id
+                # while the API still recognizes it; anything else falls
+                # through to a fresh submission instead of polling a dead
+                # id until the timeout
+                try:
+                    status = self.get_result(task_id).get("status")
+                except Exception:
+                    status = None
+                if status in ("Ready", "Pending"):
+                    self.logger.info("Reusing cached task for identical request: %s", task_id)
+                    return task_id
+                with self._task_cache_lock:
+                    self._task_cache.pop(cache_key, None)
+
         try:
             url = f"{self.base_url}/{model}"
-            response = requests.post(url, json=params, headers=self.headers, timeout=30)
+            response = self.session.post(url, json=params, timeout=30)
             response.raise_for_status()
-            task_id = response.json()["id"]
-            self.logger.info(f"Image generation task created: {task_id}")
+            task_id = _loads(response.content)["id"]
+            self.logger.info("Image generation task created: %s", task_id)
+            if cache_key is not None:
+                with self._task_cache_lock:
+                    self._task_cache[cache_key] = task_id
+                    while len(self._task_cache) > 128:
+                        self._task_cache.popitem(last=False)
             return task_id
         except requests.exceptions.Timeout:
             self.logger.error("API request timed out")
             raise TimeoutError("API request timed out")
         except requests.exceptions.RequestException as e:
-            self.logger.error(f"API request failed: {str(e)}")
+            self.logger.error("API request failed: %s", e)
             raise
 
+    def generate_batch(self, model: str, params_list: list) -> list:
+        """Submit several generation requests as one coalesced dispatch.
+
+        The BFL endpoints accept a single prompt per POST, so batching here
+        means pushing the whole group down one keep-alive connection
+        back-to-back rather than a true array payload; callers get one task
+        id per params dict either way.
+        """
+        self.logger.info("Submitting batch of %d requests", len(params_list))
+        return [self.generate_image(model, params) for params in params_list]
+
     def get_result(self, task_id: str) -> dict:
         """Get the result of the image generation task"""
-        self.logger.info(f"Fetching result for task ID: {task_id}")
+        self.logger.info("Fetching result for task ID: %s", task_id)
         try:
             url = f"{self.base_url}/get_result?id={task_id}"
-            response = requests.get(url, headers=self.headers, timeout=30)
+            response = self.session.get(url, timeout=30)
             response.raise_for_status()
-            result = response.json()
-            self.logger.debug(f"API response: {result}")
+            result = _loads(response.content)
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("API response: %s", result)
             return result
         except requests.exceptions.Timeout:
             self.logger.error("API request timed out")
             raise TimeoutError("API request timed out")
         except requests.exceptions.RequestException as e:
-            self.logger.error(f"API request failed: {str(e)}")
+            self.logger.error("API request failed: %s", e)
             raise
 
 # ----------------------------
 # GUI Components
 # ----------------------------
 
+def _decode_to_bytes(path):
+    """Decode one gallery thumbnail; runs in a worker process.
+
+    150x150 thumbnails are persisted under <dir>/.thumbs/<sha1>.webp so
+    re-opening the gallery decodes tiny WebP files instead of re-resizing
+    the originals; the key includes mtime to catch edits. Returns
+    (mode, size, raw_bytes) because PIL images don't pickle cheaply.
+    """
+    thumb_dir = os.path.join(os.path.dirname(path) or ".", ".thumbs")
+    try:
+        key = hashlib.sha1(
+            path.encode() + str(os.path.getmtime(path)).encode()).hexdigest()
+        thumb_path = os.path.join(thumb_dir, f"{key}.webp")
+    except OSError:
+        thumb_path = None
+    if thumb_path and os.path.exists(thumb_path):
+        image = Image.open(thumb_path)
+    else:
+        image = Image.open(path)
+        image.draft("RGB", (300, 300))
+        image.thumbnail((150, 150), Image.Resampling.BILINEAR)
+        if thumb_path:
+            try:
+                os.makedirs(thumb_dir, exist_ok=True)
+                image.save(thumb_path, "WEBP", quality=80)
+            except OSError:
+                pass
+    if image.mode not in ("RGB", "RGBA"):
+        image = image.convert("RGB")
+    return image.mode, image.size, image.tobytes()
+
+
 class ImagePreview:
     def __init__(self, parent):
         self.parent = parent
@@ -202,34 +404,116 @@ class ImagePreview:
 
     def update_image(self, image_path):
         image = Image.open(image_path)
-        image.thumbnail((800, 600))
+        # draft() lets libjpeg downscale in the DCT domain during decode,
+        # so multi-megapixel JPEGs never materialize at full size; BILINEAR
+        # is ~3x faster than LANCZOS and indistinguishable at preview size
+        image.draft("RGB", (1600, 1200))
+        image.thumbnail((800, 600), Image.Resampling.BILINEAR)
         self.photo = ImageTk.PhotoImage(image)
         self.image_label.configure(image=self.photo)
 
 class GalleryView:
+    # Thumbnails are decoded lazily: only tiles scrolled into view are
+    # loaded (on a small thread pool), and at most 64 PhotoImages are kept
+    # resident, so startup and memory no longer scale with the directory.
+    CELL = 160
+    MAX_RESIDENT = 64
+
     def __init__(self, parent):
         self.parent = parent
         self.canvas = ctk.CTkCanvas(parent)
         self.canvas.pack(fill=tk.BOTH, expand=True)
-        self.images = []
+        self.paths = []
+        self.images = OrderedDict()    # index -> PhotoImage (LRU-capped)
+        self._tiles = {}               # index -> canvas item id
+        self._pending = set()
+        # Decoding is CPU-bound and only partially releases the GIL, so it
+        # runs in worker processes; capped at 4 to leave headroom for the UI
+        self._pool = concurrent.futures.ProcessPoolExecutor(
+            max_workers=min(4, os.cpu_count() or 1))
+        self._last_view = None
+        self.canvas.bind("<Configure>", lambda event: self._render_visible())
+        self.canvas.after(200, self._poll_view)
 
     def load_directory(self, directory):
         for file in os.listdir(directory):
             if file.lower().endswith(('.png', '.jpg', '.jpeg')):
-                self.add_image(os.path.join(directory, file))
+                self.paths.append(os.path.join(directory, file))
+        self._update_scrollregion()
+        self._render_visible()
 
     def add_image(self, image_path):
-        image = Image.open(image_path)
-        image.thumbnail((150, 150))
-        photo = ImageTk.PhotoImage(image)
-        self.images.append(photo)
-        self.canvas.create_image(10 + len(self.images)*160, 10, anchor=tk.NW, image=photo)
+        self.paths.append(image_path)
+        self._update_scrollregion()
+        self._render_visible()
+
+    def _update_scrollregion(self):
+        self.canvas.configure(
+            scrollregion=(0, 0, 10 + len(self.paths) * self.CELL, 170))
+
+    def _poll_view(self):
+        view = (self.canvas.xview(), self.canvas.winfo_width())
+        if view != self._last_view:
+            self._last_view = view
+            self._render_visible()
+        self.canvas.after(200, self._poll_view)
+
+    def _render_visible(self):
+        if not self.paths:
+            return
+        total = 10 + len(self.paths) * self.CELL
+        x0, x1 = self.canvas.xview()
+        lo = max(0, int(x0 * total) // self.CELL - 1)
+        hi = min(len(self.paths), int(x1 * total) // self.CELL + 2)
+
+        for idx in list(self._tiles):
+            if not lo <= idx < hi:
+                self.canvas.delete(self._tiles.pop(idx))
+
+        for idx in range(lo, hi):
+            if idx in self._tiles or idx in self._pending:
+                continue
+            if idx in self.images:
+                self._place_tile(idx)
+            else:
+                self._pending.add(idx)
+                future = self._pool.submit(_decode_to_bytes, self.paths[idx])
+                future.add_done_callback(
+                    lambda f, i=idx: self.canvas.after(0, self._on_decoded, f, i))
+
+
+    def _on_decoded(self, future, idx):
+        self._pending.discard(idx)
+        try:
+            mode, size, data = future.result()
+        except Exception:
+            return
+        # Rebuild the image and PhotoImage on the Tk thread
+        self.images[idx] = ImageTk.PhotoImage(Image.frombytes(mode, size, data))
+        while len(self.images) > self.MAX_RESIDENT:
+            old_idx, _ = self.images.popitem(last=False)
+            old_tile = self._tiles.pop(old_idx, None)
+            if old_tile is not None:
+                self.canvas.delete(old_tile)
+        self._place_tile(idx)
+
+    def _place_tile(self, idx):
+        self.images.move_to_end(idx)
+        self._tiles[idx] = self.canvas.create_image(
+            10 + idx * self.CELL, 10, anchor=tk.NW, image=self.images[idx])
 
 # ----------------------------
 # Main Application Class
 # ----------------------------
 
 class FluxImageGenerator:
+    # Most recent history entries kept in memory; the JSONL file on disk
+    # retains the full record
+    HISTORY_LIMIT = 500
+
+    # Max tasks coalesced into one dispatch by the queue processor
+    MAX_DISPATCH_GROUP = 10
+
     def __init__(self):
         self.logger = logging.getLogger('FluxGenerator')
         self.logger.info("Initializing FluxImageGenerator")
@@ -246,8 +530,27 @@ class FluxImageGenerator:
 
         self.initialize_variables()
 
-        self.task_queue = queue.Queue()
-        self.batch_queue = queue.Queue()
+        # Bounded queues: backlog beyond what the workers can chew on is
+        # refused with feedback instead of buffered without limit.
+        # FLUX_WORKER_CONCURRENCY overrides the default sizing.
+        self.concurrency = int(
+            os.environ.get('FLUX_WORKER_CONCURRENCY', os.cpu_count() or 4))
+        self.task_queue = queue.Queue(maxsize=max(2, self.concurrency))
+        self.batch_queue = queue.Queue(maxsize=8)
+        # Widget updates from worker threads are funnelled through here and
+        # applied in batches on the Tk thread (see _drain_ui_queue)
+        self.ui_queue = queue.Queue()
+        # User-visible errors raised off the Tk thread end up here and are
+        # shown by _drain_errors; calling messagebox from a worker crashes
+        self.error_queue = queue.Queue()
+        self._last_batch_progress = -1
+        self._last_status_update = 0.0
+        self.shutdown_event = threading.Event()
+        # Saves append here; a 250 ms Tk timer drains it to disk so
+        # bursts of images share one file write
+        self._history_buffer = HistoryBuffer('history.jsonl')
+        # Shared request-payload bases, keyed on the non-varying fields
+        self._base_params_cache = {}
         self.history = self.load_history()
         self.favorite_prompts = self.load_favorite_prompts()
 
@@ -257,13 +560,16 @@ class FluxImageGenerator:
     def ensure_files_exist(self):
         """Ensure necessary files and directories exist"""
         os.makedirs("logs", exist_ok=True)
-        os.makedirs("output", exist_ok=True)
-        if not os.path.exists("history.json"):
-            with open("history.json", "w") as f:
-                json.dump([], f)
+        # Created once here; the save path reuses this handle instead of
+        # re-checking the directory per image. Underscored to stay clear
+        # of the output_dir StringVar.
+        self._output_dir = Path("output")
+        os.makedirs(self._output_dir, exist_ok=True)
+        if not os.path.exists("history.jsonl") and not os.path.exists("history.json"):
+            open("history.jsonl", "w").close()
         if not os.path.exists("favorites.json"):
-            with open("favorites.json", "w") as f:
-                json.dump([], f)
+            with open("favorites.json", "wb") as f:
+                f.write(_dumps([]))
 
     def load_config(self):
         """Load configuration from config file"""
@@ -282,7 +588,9 @@ class FluxImageGenerator:
             config['Settings'] = {
                 'api_key': '',
                 'theme': 'dark',
-                'output_directory': 'output'
+                'output_directory': 'output',
+                'webhook_url': '',
+                'enable_batching': 'false'
             }
             self.logger.info("Created default configuration")
             self.save_config(config)
@@ -290,13 +598,30 @@ class FluxImageGenerator:
         return config
 
     def save_config(self, config=None):
-        """Save configuration to file"""
-        if config is None:
-            config = self.config
-
+        """Save configuration, debounced so rapid changes coalesce"""
+        # Explicit configs (first-run defaults, before the window exists)
+        # are written straight through; interactive changes are debounced.
+        if config is not None or not hasattr(self, 'root'):
+            self._write_config(config if config is not None else self.config)
+            return
+        self._config_dirty = True
+        if self._config_flush_job is None:
+            self._config_flush_job = self.root.after(500, self._flush_config)
+
+    def _flush_config(self):
+        """Write out the config if any change is pending"""
+        self._config_flush_job = None
+        if self._config_dirty:
+            self._config_dirty = False
+            self._write_config(self.config)
+
+    def _write_config(self, config):
+        # Write-then-rename so a crash mid-write never truncates config.ini
         try:
-            with open('config.ini', 'w') as f:
+            tmp_path = 'config.ini.tmp'
+            with open(tmp_path, 'w') as f:
                 config.write(f)
+            os.replace(tmp_path, 'config.ini')
             self.logger.info("Configuration saved successfully")
         except Exception as e:
             self.logger.error(f"Error saving config: {str(e)}")
@@ -304,6 +629,8 @@ class FluxImageGenerator:
 
     def initialize_variables(self):
         self.logger.debug("Initializing variables")
+        self._config_dirty = False
+        self._config_flush_job = None
         self.api_key = tk.StringVar(value=self.config.get('Settings', 'api_key', fallback=''))
         self.selected_model = tk.StringVar(value="flux-pro-1.1")
         self.current_preset = tk.StringVar(value="Default")
@@ -326,17 +653,64 @@ class FluxImageGenerator:
         self.aspect_ratio_var = tk.StringVar(value="16:9")
         self.output_format_var = tk.StringVar(value="jpeg")
 
+        # Filename template is rebuilt only when the format changes, so
+        # the save path does a single str.format per image
+        self._update_fmt_template()
+        self.output_format_var.trace_add('write', self._update_fmt_template)
+
+        # Parsed numeric parameters are cached until one of the source
+        # vars changes, so queueing many jobs doesn't re-parse them
+        self._param_cache = None
+        for var in (self.width_var, self.height_var,
+                    self.safety_tolerance_var, self.guidance_var,
+                    self.steps_var):
+            var.trace_add('write', self._invalidate_param_cache)
+
+    def _update_fmt_template(self, *_args):
+        self._fmt_template = "generated_{}." + self.output_format_var.get()
+
+    def _invalidate_param_cache(self, *_args):
+        self._param_cache = None
+
+    def _numeric_params(self):
+        """Parse width/height/safety/guidance/steps once per change.
+
+        Raises ValueError when any field isn't a valid number.
+        """
+        if self._param_cache is None:
+            self._param_cache = (
+                int(self.width_var.get()),
+                int(self.height_var.get()),
+                int(self.safety_tolerance_var.get()),
+                float(self.guidance_var.get()),
+                int(self.steps_var.get()),
+            )
+        return self._param_cache
+
     def create_gui(self):
         self.logger.debug("Creating GUI")
         # Create notebook for tabs
         self.notebook = ttk.Notebook(self.root)
         self.notebook.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
 
-        # Create tabs
-        self.create_generator_tab()
-        self.create_batch_tab()
-        self.create_gallery_tab()
-        self.create_settings_tab()
+        # Placeholder frames for every tab; only the Generator is built
+        # eagerly. The rest are populated on first visit -- the gallery tab
+        # in particular walks the whole output/ directory when it builds.
+        self._tab_builders = {
+            "Generator": self.create_generator_tab,
+            "Batch Processing": self.create_batch_tab,
+            "Gallery": self.create_gallery_tab,
+            "Settings": self.create_settings_tab,
+        }
+        self._tab_frames = {}
+        self._built = {name: False for name in self._tab_builders}
+        for name in self._tab_builders:
+            frame = ctk.CTkFrame(self.notebook)
+            self.notebook.add(frame, text=name)
+            self._tab_frames[name] = frame
+
+        self._build_tab("Generator")
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
 
         # Create menu
         self.create_menu()
@@ -346,10 +720,20 @@ class FluxImageGenerator:
 
         self.logger.info("GUI created successfully")
 
-    def create_generator_tab(self):
+    def _build_tab(self, name):
+        """Build a tab's widgets the first time it is needed"""
+        if self._built[name]:
+            return
+        self._built[name] = True
+        self._tab_builders[name](self._tab_frames[name])
+
+    def _on_tab_changed(self, event):
+        name = self.notebook.tab(self.notebook.select(), "text")
+        if name in self._built:
+            self._build_tab(name)
+
+    def create_generator_tab(self, generator_frame):
         self.logger.debug("Creating generator tab")
-        generator_frame = ctk.CTkFrame(self.notebook)
-        self.notebook.add(generator_frame, text="Generator")
 
         # Split into left and right panels
         left_panel = ctk.CTkFrame(generator_frame)
@@ -439,10 +823,8 @@ class FluxImageGenerator:
             self.logger.error(f"Error creating parameter widgets: {str(e)}")
             raise
 
-    def create_batch_tab(self):
+    def create_batch_tab(self, batch_frame):
         self.logger.debug("Creating batch tab")
-        batch_frame = ctk.CTkFrame(self.notebook)
-        self.notebook.add(batch_frame, text="Batch Processing")
 
         # Split into left and right panels
         left_panel = ctk.CTkFrame(batch_frame)
@@ -478,10 +860,8 @@ class FluxImageGenerator:
         self.batch_status_label = ctk.CTkLabel(right_panel, text="Ready")
         self.batch_status_label.pack(padx=5)
 
-    def create_gallery_tab(self):
+    def create_gallery_tab(self, gallery_frame):
         self.logger.debug("Creating gallery tab")
-        gallery_frame = ctk.CTkFrame(self.notebook)
-        self.notebook.add(gallery_frame, text="Gallery")
 
         # Add gallery view
         self.gallery_view = GalleryView(gallery_frame)
@@ -490,10 +870,8 @@ class FluxImageGenerator:
         if os.path.exists("output"):
             self.gallery_view.load_directory("output")
 
-    def create_settings_tab(self):
+    def create_settings_tab(self, settings_frame):
         self.logger.debug("Creating settings tab")
-        settings_frame = ctk.CTkFrame(self.notebook)
-        self.notebook.add(settings_frame, text="Settings")
 
         # API Key
         api_frame = ctk.CTkFrame(settings_frame)
@@ -538,154 +916,403 @@ class FluxImageGenerator:
     def start_workers(self):
         """Start background worker threads"""
         self.logger.info("Starting worker threads")
+        # Generation is network-bound, so several tasks are allowed in
+        # flight at once; the pool size caps how many overlap and matches
+        # the queue bound so accepted work starts promptly.
+        self.executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max(2, self.concurrency))
+        # Separate small pool for downloads/saves so a multi-MB transfer
+        # never ties up a generation-polling worker
+        self.io_executor = concurrent.futures.ThreadPoolExecutor(max_workers=4)
+
         self.task_thread = threading.Thread(target=self.process_task_queue, daemon=True)
         self.task_thread.start()
 
         self.batch_thread = threading.Thread(target=self.process_batch_queue, daemon=True)
         self.batch_thread.start()
 
+        self.root.after(30, self._drain_ui_queue)
+        self.root.after(100, self._drain_errors)
+        self.root.after(250, self._history_flush_tick)
+
+    def _report_error(self, title, message):
+        """Queue an error dialog; safe to call from any thread"""
+        self.error_queue.put((title, message))
+
+    def _drain_errors(self):
+        """Show queued error dialogs on the Tk thread"""
+        try:
+            while True:
+                title, message = self.error_queue.get_nowait()
+                messagebox.showerror(title, message)
+        except queue.Empty:
+            pass
+        except Exception as e:
+            self.logger.error("Error dialog failed: %s", e, exc_info=True)
+        finally:
+            # Always reschedule, or one failed dialog silently disables
+            # every future error report
+            self.root.after(100, self._drain_errors)
+
+    def _drain_ui_queue(self):
+        """Apply queued widget updates on the Tk thread, max 20 per tick"""
+        # One bad callback must never kill the drain loop: the reschedule
+        # lives in a finally, and any exception is contained and logged.
+        try:
+            for _ in range(20):
+                try:
+                    update = self.ui_queue.get_nowait()
+                except queue.Empty:
+                    break
+                try:
+                    update()
+                except Exception as e:
+                    self.logger.error("UI update failed: %s", e, exc_info=True)
+        finally:
+            self.root.after(30, self._drain_ui_queue)
+
     def process_task_queue(self):
-        """Process tasks in the queue with enhanced logging"""
+        """Dispatch queued tasks to bounded concurrent workers"""
         self.logger.info("Starting task queue processor")
-        while True:
+        while not self.shutdown_event.is_set():
             try:
-                task = self.task_queue.get()
+                task = self.task_queue.get(timeout=0.5)
                 if task is None:
                     break
 
-                try:
-                    self.logger.info(f"Processing task: {task.prompt[:50]}...")
-                    self.status_var.set("Preparing generation request...")
-
-                    # Get API parameters
-                    params = {
-                        "prompt": task.prompt,
-                        "width": task.width,
-                        "height": task.height,
-                        "safety_tolerance": task.safety_tolerance,
-                        "guidance": task.guidance,
-                        "steps": task.steps,
-                        "prompt_upsampling": task.prompt_upsampling,
-                        "output_format": task.output_format
-                    }
-
-                    if task.seed is not None:
-                        params["seed"] = task.seed
-
-                    self.logger.debug(f"API parameters: {params}")
-                    self.status_var.set("Submitting to API...")
-
-                    # Generate image
-                    task_id = self.api.generate_image(
-                        self.selected_model.get(),
-                        params
-                    )
-
-                    self.logger.info(f"Task submitted with ID: {task_id}")
-                    self.status_var.set("Processing image...")
-
-                    # Monitor task with retries
-                    retry_count = 0
-                    max_retries = 60  # Adjust as needed
-                    sleep_time = 5    # Time to wait between retries in seconds
-
-                    while retry_count < max_retries:
-                        result = self.api.get_result(task_id)
-                        self.logger.debug(f"API response: {result}")
-                        self.logger.debug(f"Task status: {result['status']}")
-
-                        if result["status"] == "Ready":
-                            self.logger.info("Image generation completed")
-                            self.save_generated_image(result)
-                            self.status_var.set("Image generated successfully!")
-                            # Update preview if available
-                            if hasattr(self, 'preview'):
-                                latest_image = sorted(
-                                    [f for f in os.listdir("output") if f.endswith(('.png', '.jpg', '.jpeg'))],
-                                    key=lambda x: os.path.getctime(os.path.join("output", x))
-                                )[-1]
-                                self.preview.update_image(os.path.join("output", latest_image))
-                            break
-                        elif result["status"] == "Failed":
-                            error_msg = result.get('error', 'Unknown error')
-                            self.logger.error(f"Generation failed: {error_msg}")
-                            self.status_var.set(f"Generation failed: {error_msg}")
-                            break
-                        else:
-                            self.logger.info(f"Task {task_id} is still processing.")
-                            self.status_var.set(f"Task {task_id} is still processing... ({retry_count + 1}/{max_retries})")
-                            time.sleep(sleep_time)
-                            retry_count += 1
+                # Implicit batching: whatever queued up behind this task
+                # (e.g. a batch job's prompts) joins the same dispatch
+                group = [task]
+                while len(group) < self.MAX_DISPATCH_GROUP:
+                    try:
+                        extra = self.task_queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if extra is None:
+                        self.task_queue.put(None)
+                        break
+                    group.append(extra)
+
+                if len(group) == 1:
+                    self.executor.submit(self._run_task, task)
+                else:
+                    self.executor.submit(self._run_task_group, group)
+
+            except queue.Empty:
+                continue
+            except Exception as e:
+                self.logger.error("Queue processing error: %s", e, exc_info=True)
+                continue
 
-                    if retry_count >= max_retries:
-                        self.logger.error(f"Task {task_id} timed out after {max_retries * sleep_time} seconds")
-                        self.status_var.set(f"Task {task_id} timed out.")
+    def _build_api_params(self, task):
+        """Turn a GenerationParams into the request payload dict"""
+        # Batch tasks share everything except prompt and seed; the common
+        # base (including the config lookup for the webhook) is built once
+        # per unique field combination and copied per request.
+        base_key = (task.width, task.height, task.safety_tolerance,
+                    task.guidance, task.steps, task.prompt_upsampling,
+                    task.output_format)
+        base = self._base_params_cache.get(base_key)
+        if base is None:
+            base = {
+                "width": task.width,
+                "height": task.height,
+                "safety_tolerance": task.safety_tolerance,
+                "guidance": task.guidance,
+                "steps": task.steps,
+                "prompt_upsampling": task.prompt_upsampling,
+                "output_format": task.output_format
+            }
 
-                    self.task_queue.task_done()
+            # If the user runs a result receiver, let the API push the
+            # completion there; the poll loop still acts as the fallback,
+            # just with far less traffic to produce.
+            webhook_url = self.config.get('Settings', 'webhook_url', fallback='')
+            if webhook_url:
+                base["webhook_url"] = webhook_url
+            self._base_params_cache[base_key] = base
+
+        params = dict(base)
+        params["prompt"] = task.prompt
+        if task.seed is not None:
+            params["seed"] = task.seed
+
+        return params
+
+    def _set_status(self, message):
+        """Status bar update that is safe to call from worker threads"""
+        self.ui_queue.put(lambda: self.status_var.set(message))
+
+    # Precomputed template for the per-poll status line; formatting is
+    # deferred until the throttle check passes
+    _POLL_STATUS = "Task {tid} is still processing..."
+
+    def _set_status_throttled(self, template, **fields):
+        """Status update for hot poll loops, at most one every 0.5 s"""
+        now = time.monotonic()
+        if now - self._last_status_update < 0.5:
+            return
+        self._last_status_update = now
+        self._set_status(template.format_map(fields))
 
-                except Exception as e:
-                    self.logger.error(f"Task processing error: {str(e)}\n{traceback.format_exc()}")
-                    self.status_var.set(f"Error: {str(e)}")
-                    self.task_queue.task_done()
+    def _set_batch_progress(self, progress, text):
+        """Queue a batch progress update, dropping repeats of the same value"""
+        if int(progress) == self._last_batch_progress:
+            return
+        self._last_batch_progress = int(progress)
+
+        def apply():
+            self.batch_progress['value'] = progress
+            self.batch_status_label.configure(text=text)
+        self.ui_queue.put(apply)
+
+    def _run_task(self, task):
+        """Submit one generation request and poll it to completion"""
+        try:
+            self.logger.info("Processing task: %.50s...", task.prompt)
+            self._set_status("Preparing generation request...")
+
+            params = self._build_api_params(task)
+            self.logger.debug("API parameters: %s", params)
+            self._set_status("Submitting to API...")
+
+            # Generate image
+            task_id = self.api.generate_image(
+                self.selected_model.get(),
+                params
+            )
 
+            self.logger.info("Task submitted with ID: %s", task_id)
+            self._set_status("Processing image...")
+
+            self._poll_generation(task_id)
+
+        except Exception as e:
+            self.logger.error("Task processing error: %s", e, exc_info=True)
+            self._set_status(f"Error: {str(e)}")
+        finally:
+            self.task_queue.task_done()
+
+    def _on_image_saved(self, future):
+        """Completion callback for a save submitted to the I/O pool"""
+        try:
+            saved_path = future.result()
+        except Exception as e:
+            self.logger.error(f"Error saving image: {str(e)}")
+            return
+        if saved_path:
+            self._set_status("Image generated successfully!")
+            if hasattr(self, 'preview'):
+                self.ui_queue.put(lambda: self.preview.update_image(saved_path))
+
+    def _run_task_group(self, tasks):
+        """Submit a drained group of tasks in one dispatch, then poll each"""
+        try:
+            params_list = [self._build_api_params(task) for task in tasks]
+            self._set_status(f"Submitting {len(tasks)} queued requests...")
+            task_ids = self.api.generate_batch(
+                self.selected_model.get(), params_list)
+            for task_id in task_ids:
+                self.executor.submit(self._poll_batch_entry, task_id)
+        except Exception as e:
+            self.logger.error("Task processing error: %s", e, exc_info=True)
+            self._set_status(f"Error: {str(e)}")
+        finally:
+            for _ in tasks:
+                self.task_queue.task_done()
+
+    def _poll_generation(self, task_id):
+        """Poll one submitted generation until it finishes or times out"""
+        # Monitor the task with exponential backoff: short jobs get
+        # picked up within ~a second of finishing, long jobs back off
+        # to one poll every 10 s instead of burning API quota.
+        deadline = time.monotonic() + 300  # overall timeout in seconds
+        delay = 1.0
+        completed = False
+
+        while time.monotonic() < deadline:
+            result = self.api.get_result(task_id)
+            self.logger.debug("API response: %s", result)
+            self.logger.debug("Task status: %s", result['status'])
+
+            if result["status"] == "Ready":
+                self.logger.info("Image generation completed")
+                # Hand the download to the I/O pool; this worker is free
+                # for the next task while the image streams to disk
+                future = self.io_executor.submit(self.save_generated_image, result)
+                future.add_done_callback(self._on_image_saved)
+                completed = True
+                break
+            elif result["status"] == "Failed":
+                error_msg = result.get('error', 'Unknown error')
+                self.logger.error("Generation failed: %s", error_msg)
+                self._set_status(f"Generation failed: {error_msg}")
+                completed = True
+                break
+            else:
+                self.logger.info("Task %s is still processing.", task_id)
+                self._set_status_throttled(self._POLL_STATUS, tid=task_id)
+                # Small jitter keeps concurrent tasks from polling in
+                # lock-step; waiting on the shutdown event lets the app
+                # close without riding out the full backoff
+                if self.shutdown_event.wait(delay + random.uniform(0, 0.25)):
+                    return
+                delay = min(delay * 1.5, 10.0)
+
+        if not completed:
+            self.logger.error("Task %s timed out after 300 seconds", task_id)
+            self._set_status(f"Task {task_id} timed out.")
+
+    def _process_batch_coalesced(self, job):
+        """Submit a batch job's prompts in coalesced groups of up to ten"""
+        max_batch = 10
+        total = len(job.prompts)
+        submitted = 0
+        for start in range(0, total, max_batch):
+            group = job.prompts[start:start + max_batch]
+            # base_params stays read-only here too; see process_batch_queue
+            params_list = [
+                self._build_api_params(replace(job.base_params, prompt=prompt))
+                for prompt in group
+            ]
+
+            try:
+                task_ids = self.api.generate_batch(
+                    self.selected_model.get(), params_list)
             except Exception as e:
-                self.logger.error(f"Queue processing error: {str(e)}\n{traceback.format_exc()}")
+                self.logger.error(f"Error submitting batch group: {str(e)}")
+                if not self.batch_continue_on_error.get():
+                    break
                 continue
 
+            for task_id in task_ids:
+                self.executor.submit(self._poll_batch_entry, task_id)
+
+            submitted += len(group)
+            progress = (submitted / total) * 100
+            self._set_batch_progress(
+                progress, f"Submitted {submitted}/{total} ({progress:.1f}%)")
+
+    def _poll_batch_entry(self, task_id):
+        """Poll one batch-submitted generation on the worker pool"""
+        try:
+            self._poll_generation(task_id)
+        except Exception as e:
+            self.logger.error("Task processing error: %s", e, exc_info=True)
+
     def process_batch_queue(self):
         """Process the batch queue"""
         self.logger.info("Batch queue processor started")
-        while True:
+        while not self.shutdown_event.is_set():
             try:
-                job = self.batch_queue.get()
+                job = self.batch_queue.get(timeout=0.5)
                 if job is None:
                     break
 
                 self.logger.info(f"Processing batch job: {job.name}")
+
+                if self.config.getboolean('Settings', 'enable_batching',
+                                          fallback=False):
+                    self._process_batch_coalesced(job)
+                    self.ui_queue.put(lambda: self.batch_status_label.configure(
+                        text="Batch processing completed"))
+                    self.batch_queue.task_done()
+                    continue
+
                 for i, prompt in enumerate(job.prompts, 1):
                     try:
-                        params = job.base_params
-                        params.prompt = prompt
-                        self.task_queue.put(params)
+                        # base_params is shared by the whole job; never
+                        # mutate it, or every queued task races on prompt
+                        task = replace(job.base_params, prompt=prompt)
+                        self.task_queue.put(task)
                         progress = (i / len(job.prompts)) * 100
-                        self.batch_progress['value'] = progress
-                        self.batch_status_label.configure(
-                            text=f"Processing {i}/{len(job.prompts)} ({progress:.1f}%)")
+                        self._set_batch_progress(
+                            progress,
+                            f"Processing {i}/{len(job.prompts)} ({progress:.1f}%)")
                     except Exception as e:
                         self.logger.error(f"Error in batch processing: {str(e)}")
                         if not self.batch_continue_on_error.get():
                             break
 
-                self.batch_status_label.configure(text="Batch processing completed")
+                self.ui_queue.put(lambda: self.batch_status_label.configure(
+                    text="Batch processing completed"))
                 self.batch_queue.task_done()
 
+            except queue.Empty:
+                continue
             except Exception as e:
                 self.logger.error(f"Batch queue error: {str(e)}")
                 continue
 
     def load_history(self):
-        """Load generation history"""
+        """Load generation history from the append-only JSONL file"""
         self.logger.debug("Loading history")
+        if os.path.exists('history.jsonl'):
+            try:
+                # Stream line by line and keep only the most recent entries,
+                # so RSS stays O(maxlen) however large the file grows
+                entries = deque(maxlen=self.HISTORY_LIMIT)
+                with open('history.jsonl', 'rb') as f:
+                    for line in f:
+                        if line.strip():
+                            entries.append(_loads(line))
+                return list(entries)
+            except (ValueError, OSError) as e:
+                self.logger.error(f"Error loading history: {str(e)}")
+            return []
+        # One-time migration from the legacy array-format history.json
         if os.path.exists('history.json'):
             try:
-                with open('history.json', 'r') as f:
+                with open('history.json', 'rb') as f:
                     content = f.read().strip()
-                    return json.loads(content) if content else []
-            except json.JSONDecodeError as e:
+                entries = _loads(content) if content else []
+                # Build the new file beside the old one and swap it in
+                # atomically so a crash mid-migration can't leave a
+                # truncated history
+                tmp_path = 'history.jsonl.tmp'
+                with open(tmp_path, 'wb', buffering=262144) as f:
+                    for entry in entries:
+                        f.write(_dumps(entry) + b"\n")
+                os.replace(tmp_path, 'history.jsonl')
+                os.remove('history.json')
+                self.logger.info("Migrated history.json to history.jsonl")
+                return entries[-self.HISTORY_LIMIT:]
+            except (ValueError, OSError) as e:
                 self.logger.error(f"Error loading history: {str(e)}")
             return []
         self.logger.info("No history file found, starting fresh")
         return []
 
+    def _append_history(self, entry):
+        """Buffer one history entry; in-memory history stays authoritative"""
+        self.history.append(entry)
+        # Keep the in-memory cap honest during long sessions, not just
+        # at startup; the JSONL file retains everything
+        if len(self.history) > self.HISTORY_LIMIT:
+            del self.history[:-self.HISTORY_LIMIT]
+        # Oversized backlogs flush immediately; otherwise the timer does it
+        if self._history_buffer.append(entry):
+            self._history_buffer.flush()
+
+    def _history_flush_tick(self):
+        # A failed write (e.g. full disk) must not stop the timer; the
+        # buffered entries stay queued for the next attempt
+        try:
+            self._history_buffer.flush()
+        except OSError as e:
+            self.logger.error("History flush failed: %s", e)
+        finally:
+            self.root.after(250, self._history_flush_tick)
+
     def load_favorite_prompts(self):
         """Load favorite prompts"""
         self.logger.debug("Loading favorite prompts")
         if os.path.exists('favorites.json'):
             try:
-                with open('favorites.json', 'r') as f:
+                with open('favorites.json', 'rb') as f:
                     content = f.read().strip()
-                return json.loads(content) if content else []
-            except json.JSONDecodeError as e:
+                return _loads(content) if content else []
+            except ValueError as e:
                 self.logger.error(f"Error loading favorites: {str(e)}")
             return []
         self.logger.info("No favorites file found, starting fresh")
@@ -726,27 +1353,17 @@ class FluxImageGenerator:
                 messagebox.showerror("Error", "Please enter a prompt")
                 return
 
-            # Validate dimensions
+            # Validate parameters (cached between changes)
             try:
-                width = int(self.width_var.get())
-                height = int(self.height_var.get())
-                if width % 32 != 0 or height % 32 != 0:
-                    self.logger.error(f"Invalid dimensions: {width}x{height}")
-                    messagebox.showerror("Error", "Width and height must be multiples of 32")
-                    return
-            except ValueError:
-                self.logger.error("Invalid width or height value")
-                messagebox.showerror("Error", "Width and height must be integers")
-                return
-
-            # Validate other parameters
-            try:
-                safety_tolerance = int(self.safety_tolerance_var.get())
-                guidance = float(self.guidance_var.get())
-                steps = int(self.steps_var.get())
+                width, height, safety_tolerance, guidance, steps = \
+                    self._numeric_params()
             except ValueError:
                 self.logger.error("Invalid parameter values")
-                messagebox.showerror("Error", "Safety Tolerance, Guidance, and Steps must be numbers")
+                messagebox.showerror("Error", "Width, Height, Safety Tolerance, Guidance, and Steps must be valid numbers")
+                return
+            if width % 32 != 0 or height % 32 != 0:
+                self.logger.error(f"Invalid dimensions: {width}x{height}")
+                messagebox.showerror("Error", "Width and height must be multiples of 32")
                 return
 
             # Create parameters
@@ -772,74 +1389,99 @@ class FluxImageGenerator:
                     return
 
             self.logger.info(f"Queueing generation task with prompt: {prompt[:50]}...")
+            try:
+                self.task_queue.put(params, timeout=2)
+            except queue.Full:
+                self.status_var.set("Workers busy - please wait and retry")
+                return
             self.status_var.set("Generating image...")
-            self.task_queue.put(params)
 
         except Exception as e:
-            self.logger.error(f"Error in generate_image: {str(e)}\n{traceback.format_exc()}")
+            self.logger.error("Error in generate_image: %s", e, exc_info=True)
             messagebox.showerror("Error", f"An error occurred: {str(e)}")
 
     def save_generated_image(self, result):
         """Save generated image by downloading from the provided URL"""
         try:
-            # Ensure output directory exists
-            os.makedirs("output", exist_ok=True)
-
-            # Save image
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"generated_{timestamp}.{self.output_format_var.get()}"
-            filepath = os.path.join("output", filename)
+            # Save image. Nanosecond timestamps can't collide the way the
+            # old 1 s strftime names did when several workers save at once.
+            now_ns = time.time_ns()
+            filename = self._fmt_template.format(now_ns)
+            filepath = str(self._output_dir / filename)
 
             self.logger.info(f"Saving image to: {filepath}")
 
             # Get the image URL from the result
             image_url = result["result"]["sample"]
 
-            # Download the image
-            response = requests.get(image_url, stream=True)
-            response.raise_for_status()
-
-            with open(filepath, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
-
-            # Add to history
-            self.history.append({
+            # Download on the pooled keyless session and stream straight
+            # to disk so the image never sits fully in memory. Saves run
+            # on the I/O pool, so several downloads overlap; the split
+            # connect/read timeout keeps one stalled server from pinning
+            # a pool worker for the full minute.
+            with self.api.download_session.get(image_url, stream=True,
+                                               timeout=(10, 60)) as response:
+                response.raise_for_status()
+                # copyfileobj reads the raw urllib3 stream, which bypasses
+                # requests' decoding; re-enable it in case the server
+                # gzips the transfer
+                response.raw.decode_content = True
+
+                wanted = self.output_format_var.get().lower()
+                if wanted == "jpg":
+                    wanted = "jpeg"
+                content_type = response.headers.get("Content-Type", "").lower()
+                delivered = content_type.rpartition("/")[2].replace("jpg", "jpeg")
+
+                if delivered in ("", wanted):
+                    # Delivered format already matches (or is unknown):
+                    # a straight byte copy, no decode
+                    with open(filepath, "wb", buffering=DOWNLOAD_CHUNK_SIZE) as f:
+                        shutil.copyfileobj(response.raw, f, length=DOWNLOAD_CHUNK_SIZE)
+                else:
+                    # Real conversion: decode once and re-encode without
+                    # optimize, which would multiply PNG encode time
+                    image = Image.open(response.raw)
+                    image.save(filepath, format=wanted.upper(), optimize=False)
+
+            # Append to history (JSONL, no full rewrite)
+            self._append_history({
                 "filename": filename,
                 "params": result["result"].get("params", {}),
-                "timestamp": timestamp
+                "timestamp": datetime.fromtimestamp(
+                    now_ns / 1e9).strftime("%Y%m%d_%H%M%S")
             })
 
-            # Save history
-            with open("history.json", "w") as f:
-                json.dump(self.history, f, indent=2)
-
-            # Update gallery if available
+            # Update gallery if available; this runs on the I/O pool, so
+            # the widget work has to go through ui_queue like the preview
             if hasattr(self, 'gallery_view'):
-                self.gallery_view.add_image(filepath)
+                self.ui_queue.put(lambda: self.gallery_view.add_image(filepath))
 
             self.logger.info("Image saved successfully")
+            return filepath
 
         except Exception as e:
-            self.logger.error(f"Error saving image: {str(e)}\n{traceback.format_exc()}")
-            messagebox.showerror("Error", f"Failed to save image: {str(e)}")
+            self.logger.error("Error saving image: %s", e, exc_info=True)
+            self._report_error("Error", f"Failed to save image: {str(e)}")
+            return None
 
     def start_batch_processing(self):
         """Start processing batch jobs"""
         self.logger.info("Starting batch processing")
-        # Extract prompts from the batch text input
-        prompts = self.batch_text.get("1.0", tk.END).strip().split("\n")
-        if not prompts or prompts == [""]:
+        # Extract prompts from the batch text input, dropping blank lines
+        # up front rather than queueing them
+        prompts = [p for p in
+                   (line.strip() for line in
+                    self.batch_text.get("1.0", tk.END).splitlines())
+                   if p]
+        if not prompts:
             messagebox.showerror("Error", "No prompts provided for batch processing")
             return
 
         # Validate and convert parameters
         try:
-            width = int(self.width_var.get())
-            height = int(self.height_var.get())
-            safety_tolerance = int(self.safety_tolerance_var.get())
-            guidance = float(self.guidance_var.get())
-            steps = int(self.steps_var.get())
+            width, height, safety_tolerance, guidance, steps = \
+                self._numeric_params()
         except ValueError:
             self.logger.error("Invalid parameter values for batch job")
             messagebox.showerror("Error", "Width, Height, Safety Tolerance, Guidance, and Steps must be valid numbers")
@@ -862,18 +1504,42 @@ class FluxImageGenerator:
         self.logger.info(f"Batch job '{job_name}' added to queue")
         self.batch_status_label.configure(text="Batch job queued")
 
+    def _on_close(self):
+        """Window-close handler: persist pending state, then tear down"""
+        self.logger.info("Shutting down")
+        # Stop the worker loops and unblock their queue gets so in-flight
+        # requests wind down instead of dying mid-TLS with the process
+        self.shutdown_event.set()
+        # Sentinels are best-effort: if a queue is full, the 0.5 s get
+        # timeout lets the loops notice the event on their own
+        try:
+            self.task_queue.put_nowait(None)
+        except queue.Full:
+            pass
+        try:
+            self.batch_queue.put_nowait(None)
+        except queue.Full:
+            pass
+        self.executor.shutdown(wait=False)
+        self.io_executor.shutdown(wait=False)
+        if self._config_flush_job is not None:
+            self.root.after_cancel(self._config_flush_job)
+        self._flush_config()
+        self._history_buffer.flush()
+        self.root.destroy()
+
     def run(self):
         """Start the application"""
         self.logger.info("Starting application")
         try:
-            # Create necessary directories
-            os.makedirs("output", exist_ok=True)
+            # Flush any pending config write before the window goes away
+            self.root.protocol("WM_DELETE_WINDOW", self._on_close)
 
             # Start main loop
             self.root.mainloop()
 
         except Exception as e:
-            self.logger.critical(f"Application error: {str(e)}\n{traceback.format_exc()}")
+            self.logger.critical("Application error: %s", e, exc_info=True)
             raise
 
 # ----------------------------
@@ -890,7 +1556,7 @@ def main():
         app.run()
     except Exception as e:
         logger = logging.getLogger('FluxGenerator')
-        logger.critical(f"Application failed to start: {str(e)}\n{traceback.format_exc()}")
+        logger.critical("Application failed to start: %s", e, exc_info=True)
         messagebox.showerror("Critical Error", f"Application failed to start: {str(e)}")
         raise
 